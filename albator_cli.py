@@ -2,6 +2,7 @@ import argparse
 import contextlib
 import io
 import json
+import shutil
 import subprocess
 import sys
 import yaml
@@ -12,7 +13,7 @@ from preflight import format_preflight_report, preflight_to_json, run_preflight
 from rule_handler import collect_rules
 from fix import fix, format_fix_report
 from rollback import (
-    apply_rollback, find_metadata_files, list_rollbacks,
+    apply_rollback, find_latest_metadata, list_rollbacks,
     format_rollback_list, format_rollback_report,
 )
 from report import generate_report, format_text_report, format_csv_report
@@ -22,10 +23,10 @@ from baseline import (
     format_diff_report, format_baseline_list,
 )
 from evidence import (
-    collect_system_metadata, collect_rule_evidence, save_evidence,
+    collect_system_metadata, collect_evidence, save_evidence,
     format_evidence_summary,
 )
-from utils import parse_authors
+from utils import get_macos_version, parse_authors
 
 CONFIG_PATHS = ("config.yaml", os.path.join("config", "albator.yaml"))
 
@@ -242,7 +243,7 @@ def run_doctor(config: dict, policy: dict, scripts: dict[str, str], json_output:
     checks.append(("preflight", summary["passed"], f"required_failures={summary['failed_required_count']}, warnings={summary['warning_count']}"))
 
     for dep in config.get("dependencies", {}).get("required", ["curl", "jq"]):
-        present = subprocess.run(["which", dep], capture_output=True, text=True).returncode == 0
+        present = shutil.which(dep) is not None
         checks.append((f"dependency:{dep}", present, "present" if present else "missing"))
 
     for name, script in scripts.items():
@@ -251,10 +252,9 @@ def run_doctor(config: dict, policy: dict, scripts: dict[str, str], json_output:
         checks.append((f"script_exists:{name}", exists, script))
         checks.append((f"script_executable:{name}", exists and executable, script))
 
-    current = subprocess.run(["sw_vers", "-productVersion"], capture_output=True, text=True, check=False)
-    current_version = (current.stdout or "unknown").strip()
-    meets = _version_tuple(current_version) >= _version_tuple(policy["min_macos_version"]) if current.returncode == 0 else False
-    checks.append(("min_macos_policy", meets, f"current={current_version}, min={policy['min_macos_version']}"))
+    current_version = get_macos_version()
+    meets = _version_tuple(current_version) >= _version_tuple(policy["min_macos_version"]) if current_version else False
+    checks.append(("min_macos_policy", meets, f"current={current_version or 'unknown'}, min={policy['min_macos_version']}"))
 
     failures = 0
     serialized_checks = []
@@ -479,7 +479,7 @@ def main():
                 exempt_ids = get_exempt_ids(exemptions)
                 ev_rules = [r for r in ev_rules if r["id"] not in exempt_ids]
             sys_meta = collect_system_metadata()
-            evidence_list = [collect_rule_evidence(r, timeout=args.timeout, odv_values=ev_odv) for r in ev_rules]
+            evidence_list = collect_evidence(ev_rules, timeout=args.timeout, odv_values=ev_odv)
             manifest_path = save_evidence(evidence_list, args.evidence_dir,
                                           system_metadata=sys_meta, label=args.evidence_label)
             manifest = json.load(open(manifest_path))
@@ -546,15 +546,14 @@ def main():
         # Determine metadata file
         meta_file = args.metadata_file
         if args.latest or meta_file is None:
-            files = find_metadata_files(state_dir)
-            if not files:
+            meta_file = find_latest_metadata(state_dir)
+            if meta_file is None:
                 if args.json_output:
                     _print_json({"command": "rollback", "success": False,
                                  "error": f"No rollback metadata files found in {state_dir}"})
                 else:
                     print(f"Error: No rollback metadata files found in {state_dir}", file=sys.stderr)
                 sys.exit(2)
-            meta_file = files[0]
 
         try:
             result = apply_rollback(
@@ -11,11 +11,15 @@ import argparse
 import subprocess
 import logging
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-# Add lib directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+# Add lib directory to path for imports. Only when it exists: a dead entry at
+# the front of sys.path is probed by every later import in the process.
+_LIB_DIR = os.path.join(os.path.dirname(__file__), 'lib')
+if os.path.isdir(_LIB_DIR):
+    sys.path.insert(0, _LIB_DIR)
 
 
 def _fallback_logger(name: str):
@@ -68,7 +72,6 @@ class AlbatorEnhanced:
         try:
             self.config_manager = ConfigurationManager(config_path) if ConfigurationManager else None
             self.compliance_reporter = ComplianceReporter(config_path) if ComplianceReporter else None
-            self.analytics_dashboard = AnalyticsDashboard() if AnalyticsDashboard else None
             self.fleet_manager = FleetManager(config_path) if FleetManager else None
             self.rollback_manager = RollbackManager() if RollbackManager else None
             
@@ -80,13 +83,23 @@ class AlbatorEnhanced:
             print(f"Warning: Could not initialize all managers: {e}")
             self.config_manager = None
             self.compliance_reporter = None
-            self.analytics_dashboard = None
             self.fleet_manager = None
             self.rollback_manager = None
             self.command_history = None
             self.batch_processor = None
             self.plugin_manager = None
     
+    @cached_property
+    def analytics_dashboard(self):
+        """Analytics dashboard, constructed on first use rather than at startup"""
+        if not AnalyticsDashboard:
+            return None
+        try:
+            return AnalyticsDashboard()
+        except Exception as e:
+            print(f"Warning: Could not initialize analytics dashboard: {e}")
+            return None
+    
     def run_hardening_script(self, script_name: str, profile: str = "basic", 
                            dry_run: bool = False, test: bool = False) -> bool:
         """Run a hardening script with enhanced options"""
@@ -215,7 +215,7 @@ verify_encryption_status() {
     
     # Check encryption progress
     local encryption_progress
-    encryption_progress=$(fdesetup status 2>/dev/null | grep -i "percent\|progress" || echo "")
+    encryption_progress=$(grep -i "percent\|progress" <<< "$fv_status" || echo "")
     
     if [[ -n "$encryption_progress" ]]; then
         show_warning "Encryption in progress: $encryption_progress"
@@ -250,7 +250,7 @@ display_encryption_summary() {
     
     # Encryption progress
     local progress
-    progress=$(fdesetup status 2>/dev/null | grep -i "percent" | head -1 || echo "Complete or not started")
+    progress=$(grep -i "percent" <<< "$fv_status" | head -1 || echo "Complete or not started")
     printf "%-25s: %s\n" "Encryption Progress" "$progress"
     
     # Recovery key status
@@ -11,6 +11,10 @@ import json
 import os
 import platform
 import subprocess
+import time
+
+from scan import DEFAULT_CHECK_WORKERS, map_rules
+from utils import get_macos_version
 
 
 def collect_system_metadata():
@@ -22,17 +26,8 @@ def collect_system_metadata():
     now = datetime.datetime.now(datetime.timezone.utc)
     user = os.environ.get("USER", os.environ.get("LOGNAME", "unknown"))
 
-    # Try to get macOS version; falls back gracefully on non-macOS
-    macos_version = "unknown"
-    try:
-        result = subprocess.run(
-            ["sw_vers", "-productVersion"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            macos_version = result.stdout.strip()
-    except (OSError, subprocess.TimeoutExpired):
-        pass
+    # Falls back gracefully on non-macOS
+    macos_version = get_macos_version() or "unknown"
 
     return {
         "hostname": platform.node(),
@@ -62,7 +57,9 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
     from odv import get_effective_check_command
 
     check_cmd = get_effective_check_command(rule, odv_values)
-    start = datetime.datetime.now(datetime.timezone.utc)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    # Durations come from the monotonic clock rather than datetime arithmetic
+    started = time.monotonic()
 
     evidence = {
         "rule_id": rule["id"],
@@ -80,7 +77,7 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
             "exit_code": -1,
             "duration_ms": 0,
             "error": "empty check command",
-            "timestamp": start.isoformat(),
+            "timestamp": timestamp,
         })
         return evidence
 
@@ -89,8 +86,7 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
             ["bash", "-c", check_cmd],
             capture_output=True, text=True, timeout=timeout
         )
-        end = datetime.datetime.now(datetime.timezone.utc)
-        duration_ms = int((end - start).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - started) * 1000)
 
         evidence.update({
             "compliant": result.returncode == 0,
@@ -98,11 +94,10 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
             "stderr": (result.stderr or "").strip(),
             "exit_code": result.returncode,
             "duration_ms": duration_ms,
-            "timestamp": start.isoformat(),
+            "timestamp": timestamp,
         })
     except subprocess.TimeoutExpired:
-        end = datetime.datetime.now(datetime.timezone.utc)
-        duration_ms = int((end - start).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - started) * 1000)
         evidence.update({
             "compliant": False,
             "stdout": "",
@@ -110,11 +105,10 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
             "exit_code": -1,
             "duration_ms": duration_ms,
             "error": f"check timed out after {timeout}s",
-            "timestamp": start.isoformat(),
+            "timestamp": timestamp,
         })
     except OSError as e:
-        end = datetime.datetime.now(datetime.timezone.utc)
-        duration_ms = int((end - start).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - started) * 1000)
         evidence.update({
             "compliant": False,
             "stdout": "",
@@ -122,12 +116,22 @@ def collect_rule_evidence(rule, timeout=30, odv_values=None):
             "exit_code": -1,
             "duration_ms": duration_ms,
             "error": str(e),
-            "timestamp": start.isoformat(),
+            "timestamp": timestamp,
         })
 
     return evidence
 
 
+def collect_evidence(rules, timeout=30, odv_values=None, workers=DEFAULT_CHECK_WORKERS):
+    """Collect evidence for several rules concurrently.
+
+    Returns a list of evidence dicts in the same order as rules.
+    """
+    return map_rules(
+        lambda rule: collect_rule_evidence(rule, timeout=timeout, odv_values=odv_values), rules, workers
+    )
+
+
 def save_evidence(evidence_list, evidence_dir, system_metadata=None, label=None):
     """Save evidence artifacts to a directory.
 
@@ -164,11 +168,13 @@ def save_evidence(evidence_list, evidence_dir, system_metadata=None, label=None)
             "evidence": ev,
         }
 
-        content = json.dumps(artifact, indent=2, sort_keys=True)
-        with open(filepath, "w") as f:
+        # Per-rule artifacts are compact; only the manifest is pretty-printed.
+        content = json.dumps(artifact, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        with open(filepath, "wb") as f:
             f.write(content)
 
-        checksum = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        # Hash the exact bytes written rather than re-encoding the text
+        checksum = hashlib.sha256(content).hexdigest()
 
         if ev.get("compliant"):
             compliant_count += 1
@@ -53,6 +53,8 @@ def load_exemptions(path):
 
     exemptions = []
     seen_ids = set()
+    # One reference time for the whole file, not a clock read per entry
+    now = datetime.now(timezone.utc)
     for i, entry in enumerate(raw):
         if not isinstance(entry, dict):
             raise ValueError(f"Exemption entry {i} must be a mapping")
@@ -79,7 +81,7 @@ def load_exemptions(path):
                 exp_date = datetime.strptime(expires, "%Y-%m-%d").replace(
                     tzinfo=timezone.utc
                 )
-                if datetime.now(timezone.utc) > exp_date:
+                if now > exp_date:
                     expired = True
             except ValueError:
                 raise ValueError(
@@ -111,6 +113,14 @@ def get_exempt_ids(exemptions, include_expired=False):
     return ids
 
 
+def get_exemptions_by_id(exemptions):
+    """Return a dict mapping rule ID to its exemption entry.
+
+    load_exemptions rejects duplicate rule IDs, so each ID maps to one entry.
+    """
+    return {ex["rule_id"]: ex for ex in exemptions or ()}
+
+
 def filter_rules_with_exemptions(rules, exempt_ids):
     """Split rules into (active_rules, exempted_rules) based on exempt IDs.
 
@@ -11,7 +11,8 @@ import time
 
 from scan import load_rules, load_profile, filter_rules_by_profile, filter_rules_by_severity, run_check
 from odv import load_odv_defaults, get_effective_fix_command
-from exemptions import load_exemptions, get_exempt_ids, filter_rules_with_exemptions
+from exemptions import load_exemptions, get_exempt_ids, get_exemptions_by_id, \
+    filter_rules_with_exemptions
 from dependencies import load_dependency_graph, topological_sort
 
 
@@ -148,10 +149,9 @@ def fix(rules_dir, profiles_dir=None, profile_name=None,
         results.append(entry)
 
     # Add exempted rules to results
+    exemption_by_id = get_exemptions_by_id(exemptions)
     for rule in exempted_rules:
-        ex_info = None
-        if exemptions:
-            ex_info = next((e for e in exemptions if e["rule_id"] == rule["id"]), None)
+        ex_info = exemption_by_id.get(rule["id"])
         entry = {
             "id": rule["id"],
             "title": rule.get("title", ""),
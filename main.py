@@ -8,7 +8,11 @@ from tkinter import messagebox, simpledialog
 from typing import List, Optional
 from arg_parser import create_args
 from rule_handler import collect_rules, get_controls, output_baseline, odv_query
-from utils import parse_authors, append_authors, available_tags, sanitised_input
+from utils import parse_authors, append_authors, available_tags, sanitised_input, get_macos_version
+
+# Used once per rule while filtering by macOS version
+_MAJOR_VERSION_RE = re.compile(r"(\d+)")
+_VERSION_LIST_SEP_RE = re.compile(r"[,\s]+")
 
 class BaselineGenerator:
     """Generates security baselines, applies fixes, and provides interfaces for macOS tuning."""
@@ -32,7 +36,7 @@ class BaselineGenerator:
         """Extract major version from a version string like 26.3 or 15."""
         if not version_string:
             return None
-        match = re.search(r"(\d+)", str(version_string))
+        match = _MAJOR_VERSION_RE.search(str(version_string))
         if not match:
             return None
         return int(match.group(1))
@@ -42,15 +46,7 @@ class BaselineGenerator:
         env_override = os.environ.get("ALBATOR_MACOS_VERSION")
         if env_override:
             return self._parse_major_version(env_override)
-        try:
-            result = subprocess.run(
-                ["sw_vers", "-productVersion"], capture_output=True, text=True, check=False
-            )
-            if result.returncode == 0:
-                return self._parse_major_version(result.stdout.strip())
-        except Exception:
-            return None
-        return None
+        return self._parse_major_version(get_macos_version())
 
     def _is_rule_version_compatible(self, rule, target_major: Optional[int]) -> bool:
         """Check whether a rule applies to the detected macOS major version."""
@@ -60,7 +56,7 @@ class BaselineGenerator:
         if raw in (None, "", "missing"):
             return True
 
-        tokens = raw if isinstance(raw, list) else re.split(r"[,\s]+", str(raw))
+        tokens = raw if isinstance(raw, list) else _VERSION_LIST_SEP_RE.split(str(raw))
         majors = {m for token in tokens for m in [self._parse_major_version(token)] if m is not None}
         if not majors:
             return True
@@ -25,6 +25,9 @@ ODV_SCHEMA = {
     "home_folder_permissions": str,
 }
 
+# Keys every structured (non-"none") rule ODV must define
+ODV_REQUIRED_KEYS = frozenset({"variable", "default", "description", "type"})
+
 DEFAULT_ODV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "config", "odv_defaults.yaml"
 )
@@ -230,8 +233,7 @@ def validate_rules_odv_consistency(rules):
             errors.append(f"rule '{rule_id}' has invalid odv type: {type(odv).__name__}")
             continue
 
-        required_keys = {"variable", "default", "description", "type"}
-        missing_keys = required_keys - set(odv.keys())
+        missing_keys = ODV_REQUIRED_KEYS - odv.keys()
         if missing_keys:
             errors.append(f"rule '{rule_id}' ODV missing keys: {', '.join(sorted(missing_keys))}")
             continue
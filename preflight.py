@@ -23,7 +23,8 @@ class PreflightCheck:
 
 def _run_quick(cmd: List[str]) -> bool:
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # Only the exit status matters, so don't pipe or decode any output
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         return result.returncode == 0
     except Exception:
         return False
@@ -140,19 +141,26 @@ def _check_config_file(root_dir: str) -> PreflightCheck:
     return PreflightCheck("config_file", STATUS_WARN, "No readable config file found (using defaults)", False)
 
 
+def _contains_yaml_file(directory: str) -> bool:
+    """Return True as soon as a .yaml file is found anywhere under directory."""
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".yaml"):
+                        return True
+        except OSError:
+            continue
+    return False
+
+
 def _check_rule_dirs(root_dir: str, require_rules: bool) -> PreflightCheck:
     rules_dir = os.path.join(root_dir, "rules")
     custom_rules_dir = os.path.join(root_dir, "custom", "rules")
-    found = False
-
-    for candidate in (rules_dir, custom_rules_dir):
-        if os.path.isdir(candidate):
-            for _base, _dirs, files in os.walk(candidate):
-                if any(file.endswith(".yaml") for file in files):
-                    found = True
-                    break
-        if found:
-            break
+    found = any(_contains_yaml_file(candidate) for candidate in (rules_dir, custom_rules_dir))
 
     if found:
         return PreflightCheck("rule_files", STATUS_PASS, "Rule YAML files detected", require_rules)
@@ -30,22 +30,21 @@ LOG_FILE="/tmp/albator_privacy.log"
 BACKUP_DIR="/tmp/albator_backup/privacy"
 DRY_RUN=${DRY_RUN:-false}
 
-# Function to backup current setting
+# Function to backup current setting (value as already read by the caller)
 backup_setting() {
     local domain=$1
     local key=$2
-    local safe_domain
-    local safe_key
-    safe_domain=$(echo "$domain" | sed 's#^/##; s#[^A-Za-z0-9._-]#_#g')
-    safe_key=$(echo "$key" | sed 's#[^A-Za-z0-9._-]#_#g')
+    local value=$3
+    local safe_domain="${domain#/}"
+    local safe_key="$key"
+    safe_domain="${safe_domain//[^A-Za-z0-9._-]/_}"
+    safe_key="${safe_key//[^A-Za-z0-9._-]/_}"
     local backup_file="$BACKUP_DIR/${safe_domain}_${safe_key}.backup"
-    
-    mkdir -p "$BACKUP_DIR"
-    
-    if [[ "$domain" == "/Library/Preferences/"* ]]; then
-        sudo defaults read "$domain" "$key" 2>/dev/null > "$backup_file" || echo "NOT_SET" > "$backup_file"
+
+    if [[ "$value" == "MISSING" ]]; then
+        echo "NOT_SET" > "$backup_file"
     else
-        defaults read "$domain" "$key" 2>/dev/null > "$backup_file" || echo "NOT_SET" > "$backup_file"
+        printf '%s\n' "$value" > "$backup_file"
     fi
     
     log "INFO" "Backed up $domain $key to $backup_file"
@@ -62,15 +61,16 @@ apply_setting() {
     
     show_progress "Configuring: $description"
     
-    # Backup current setting
-    backup_setting "$domain" "$key"
-
+    # Read the current value once; it feeds both the backup and the compliance check
     local existing_value
     if [[ "$use_sudo" == "true" ]]; then
         existing_value=$(sudo defaults read "$domain" "$key" 2>/dev/null || echo "MISSING")
     else
         existing_value=$(defaults read "$domain" "$key" 2>/dev/null || echo "MISSING")
     fi
+
+    # Backup current setting
+    backup_setting "$domain" "$key" "$existing_value"
     if [[ "$existing_value" == "$value" ]] || [[ "$existing_value" == "1" && "$value" == "true" ]] || [[ "$existing_value" == "0" && "$value" == "false" ]]; then
         show_success "$description already compliant"
         record_noop "$description already compliant"
@@ -186,7 +186,8 @@ disable_service() {
         return 0
     fi
     
-    if sudo launchctl list | grep -q "$service_name" 2>/dev/null; then
+    # Ask launchd for the one label instead of grepping the whole service list
+    if sudo launchctl list "$service_name" >/dev/null 2>&1; then
         if sudo launchctl unload -w "/System/Library/LaunchDaemons/$service_name.plist" 2>>"$LOG_FILE"; then
             show_success "$description disabled"
             record_rollback_change "$service_name" "$description disabled" "sudo launchctl load -w /System/Library/LaunchDaemons/$service_name.plist"
@@ -207,6 +208,9 @@ configure_privacy() {
     local errors=0
     
     show_progress "Starting privacy configuration..."
+
+    # Created once here rather than on every backup_setting call
+    mkdir -p "$BACKUP_DIR"
     
     # Disable telemetry (diagnostic reports)
     apply_setting "/Library/Preferences/com.apple.SubmitDiagInfo" "AutoSubmit" "false" "bool" "Diagnostic reports submission" "true" || ((errors++))
@@ -280,7 +284,7 @@ verify_settings() {
     done
     
     # Check SMB service
-    if ! sudo launchctl list | grep -q "com.apple.smbd" 2>/dev/null; then
+    if ! sudo launchctl list "com.apple.smbd" >/dev/null 2>&1; then
         show_success "✓ SMB sharing disabled"
     else
         show_error "✗ SMB sharing still enabled"
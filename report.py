@@ -12,9 +12,9 @@ from collections import OrderedDict
 from datetime import datetime, timezone
 
 from scan import load_rules, load_profile, filter_rules_by_profile, \
-    filter_rules_by_severity, run_check
+    filter_rules_by_severity, run_checks, DEFAULT_CHECK_WORKERS
 from odv import load_odv_defaults, get_effective_check_command
-from exemptions import load_exemptions, get_exempt_ids
+from exemptions import load_exemptions, get_exempt_ids, get_exemptions_by_id
 
 
 # ---------------------------------------------------------------------------
@@ -140,7 +140,7 @@ def _nist_families_from_rules(rules):
 
 def generate_report(rules_dir, profiles_dir=None, profile_name=None,
                     min_severity=None, dry_run=False, timeout=30, odv_file=None,
-                    exempt_file=None):
+                    exempt_file=None, workers=DEFAULT_CHECK_WORKERS):
     """Generate a comprehensive compliance report.
 
     Returns a dict with:
@@ -174,10 +174,20 @@ def generate_report(rules_dir, profiles_dir=None, profile_name=None,
         exemptions = load_exemptions(exempt_file)
         exempt_ids = get_exempt_ids(exemptions)
 
-    # Index rules by ID for quick lookup
+    # Index rules and exemptions by ID for quick lookup
     rule_by_id = {r["id"]: r for r in rules}
+    exemption_by_id = get_exemptions_by_id(exemptions)
+
+    # Several CIS controls can map to the same rule, so run each in-scope
+    # rule's check once, concurrently, and reuse its outcome per control.
+    check_outcomes = {}
+    if not dry_run:
+        cis_rule_ids = dict.fromkeys(ctrl["rule"] for ctrl in CIS_CONTROLS.values())
+        to_check = [rule_by_id[rid] for rid in cis_rule_ids
+                    if rid in rule_by_id and rid not in exempt_ids]
+        outcomes = run_checks(to_check, timeout=timeout, odv_values=odv_values, workers=workers)
+        check_outcomes = {rule["id"]: outcome for rule, outcome in zip(to_check, outcomes)}
 
-    # Run checks for each CIS control
     cis_results = OrderedDict()
     passed = 0
     failed = 0
@@ -202,7 +212,7 @@ def generate_report(rules_dir, profiles_dir=None, profile_name=None,
         elif rule_id in exempt_ids:
             entry["status"] = "exempt"
             entry["severity"] = rule.get("severity", "unknown")
-            ex_info = next((e for e in exemptions if e["rule_id"] == rule_id), None)
+            ex_info = exemption_by_id.get(rule_id)
             if ex_info:
                 entry["exempt_reason"] = ex_info["reason"]
                 entry["exempt_approved_by"] = ex_info["approved_by"]
@@ -214,7 +224,7 @@ def generate_report(rules_dir, profiles_dir=None, profile_name=None,
             entry["severity"] = rule.get("severity", "unknown")
             entry["check"] = get_effective_check_command(rule, odv_values)
         else:
-            ok, detail = run_check(rule, timeout=timeout, odv_values=odv_values)
+            ok, detail = check_outcomes[rule_id]
             entry["severity"] = rule.get("severity", "unknown")
             if ok:
                 entry["status"] = "pass"
@@ -226,9 +236,8 @@ def generate_report(rules_dir, profiles_dir=None, profile_name=None,
 
         cis_results[cis_id] = entry
 
-    # Avoid double-counting rules that map to multiple CIS controls
-    # (already handled by running checks per CIS control — same rule
-    #  may pass for both 2.3.3.1 and 2.3.3.2 for example)
+    # Results are counted per CIS control, so a rule mapped to several
+    # controls (e.g. 2.3.3.1 and 2.3.3.2) counts once for each of them.
 
     total_evaluated = passed + failed
     compliance_pct = round(100.0 * passed / total_evaluated, 1) if total_evaluated > 0 else 0.0
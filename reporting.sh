@@ -75,7 +75,13 @@ EOF
 # Function to check security status
 check_security_status() {
     show_progress "Checking security configurations..."
-    
+
+    # Query each status tool once; both the flag and the raw text come from it
+    local fv_out gk_out sip_out
+    fv_out=$(fdesetup status 2>/dev/null) || fv_out="Unknown"
+    gk_out=$(spctl --status 2>/dev/null) || gk_out="Unknown"
+    sip_out=$(csrutil status 2>/dev/null) || sip_out="Unknown"
+
     local security_status=$(cat <<EOF
 {
     "firewall": {
@@ -84,16 +90,16 @@ check_security_status() {
         "logging": $(sudo /usr/libexec/ApplicationFirewall/socketfilterfw --getloggingmode 2>/dev/null | grep -q "on" && echo "true" || echo "false")
     },
     "filevault": {
-        "enabled": $(fdesetup status 2>/dev/null | grep -q "On" && echo "true" || echo "false"),
-        "status": "$(fdesetup status 2>/dev/null || echo "Unknown")"
+        "enabled": $([[ "$fv_out" == *On* ]] && echo "true" || echo "false"),
+        "status": "$fv_out"
     },
     "gatekeeper": {
-        "enabled": $(spctl --status 2>/dev/null | grep -q "enabled" && echo "true" || echo "false"),
-        "status": "$(spctl --status 2>/dev/null || echo "Unknown")"
+        "enabled": $([[ "$gk_out" == *enabled* ]] && echo "true" || echo "false"),
+        "status": "$gk_out"
     },
     "sip": {
-        "enabled": $(csrutil status 2>/dev/null | grep -q "enabled" && echo "true" || echo "false"),
-        "status": "$(csrutil status 2>/dev/null || echo "Unknown")"
+        "enabled": $([[ "$sip_out" == *enabled* ]] && echo "true" || echo "false"),
+        "status": "$sip_out"
     },
     "automatic_updates": {
         "enabled": $(defaults read /Library/Preferences/com.apple.SoftwareUpdate AutomaticCheckEnabled 2>/dev/null | grep -q "1" && echo "true" || echo "false"),
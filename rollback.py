@@ -9,6 +9,7 @@ applies rollback commands in LIFO order.
 import glob
 import json
 import os
+import shlex
 import subprocess
 
 
@@ -21,6 +22,43 @@ def find_metadata_files(state_dir):
     return files
 
 
+def find_latest_metadata(state_dir):
+    """Return the newest rollback metadata file path, or None if there is none.
+
+    Uses the same ordering as find_metadata_files but takes the maximum in a
+    single pass instead of sorting every file name.
+    """
+    if not os.path.isdir(state_dir):
+        return None
+    pattern = os.path.join(state_dir, "*_rollback_*.json")
+    return max(glob.iglob(pattern), default=None)
+
+
+def pending_changes_path(path):
+    """Return the JSON-lines file holding changes not yet folded into *path*.
+
+    Hardening scripts append changes there and fold them into the metadata
+    file when they finish (see utils.sh); it only survives an interrupted run.
+    """
+    root, _ = os.path.splitext(path)
+    return root + ".pending.jsonl"
+
+
+def merge_pending_changes(path, data):
+    """Append unfolded changes from the pending JSON-lines file to *data*."""
+    pending = pending_changes_path(path)
+    if not os.path.isfile(pending):
+        return data
+    changes = list(data.get("changes", []))
+    with open(pending) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                changes.append(json.loads(line))
+    data["changes"] = changes
+    return data
+
+
 def load_metadata(path):
     """Load and validate a rollback metadata JSON file."""
     if not os.path.isfile(path):
@@ -29,7 +67,7 @@ def load_metadata(path):
         data = json.load(f)
     if not isinstance(data, dict):
         raise ValueError(f"Invalid metadata format in {path}: expected object")
-    return data
+    return merge_pending_changes(path, data)
 
 
 def list_rollbacks(state_dir):
@@ -89,11 +127,14 @@ def apply_rollback(metadata_path, dry_run=False, timeout=30):
         component = change.get("component", "")
         detail = change.get("detail", "")
         rollback_cmd = change.get("rollback_command", "")
+        argv = None
 
-        # Fallback: if component looks like domain/key, use defaults delete
+        # Fallback: if component looks like domain/key, use defaults delete.
+        # Keep it as argv so it runs without a shell and needs no quoting.
         if not rollback_cmd and "/" in component:
             domain, key = component.split("/", 1)
-            rollback_cmd = f"defaults delete {domain} {key}"
+            argv = ["defaults", "delete", domain, key]
+            rollback_cmd = shlex.join(argv)
 
         entry = {
             "component": component,
@@ -117,7 +158,7 @@ def apply_rollback(metadata_path, dry_run=False, timeout=30):
         # Execute rollback command
         try:
             proc = subprocess.run(
-                ["bash", "-c", rollback_cmd],
+                argv or ["bash", "-c", rollback_cmd],
                 capture_output=True, text=True, timeout=timeout
             )
             if proc.returncode == 0:
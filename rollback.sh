@@ -46,14 +46,24 @@ list_metadata_files() {
         return 1
     fi
     local count=0
+    local has_jq=false
+    command -v jq >/dev/null 2>&1 && has_jq=true
     while IFS= read -r f; do
         if [[ -n "$f" ]]; then
-            local script_name status
-            if command -v jq >/dev/null 2>&1; then
-                script_name=$(jq -r '.script // "unknown"' "$f" 2>/dev/null || echo "unknown")
-                status=$(jq -r '.status // "unknown"' "$f" 2>/dev/null || echo "unknown")
-                local num_changes
-                num_changes=$(jq '.changes | length' "$f" 2>/dev/null || echo "0")
+            if [[ "$has_jq" == "true" ]]; then
+                # One jq pass per file for all summary fields, counting changes
+                # an interrupted script appended but never folded in
+                local summary script_name status num_changes pending_file
+                local summary_filter='[.script // "unknown", .status // "unknown", (.changes | length)] | @tsv'
+                pending_file=$(pending_entries_file "$f")
+                if [[ -s "$pending_file" ]]; then
+                    summary=$(jq -r --slurpfile pending "$pending_file" ".changes += \$pending | $summary_filter" "$f" 2>/dev/null) \
+                        || summary=$'unknown\tunknown\t0'
+                else
+                    summary=$(jq -r "$summary_filter" "$f" 2>/dev/null) \
+                        || summary=$'unknown\tunknown\t0'
+                fi
+                IFS=$'\t' read -r script_name status num_changes <<< "$summary"
                 echo "  $f  (script=$script_name, status=$status, changes=$num_changes)"
             else
                 echo "  $f"
@@ -80,10 +90,18 @@ apply_rollback_from_file() {
         return 1
     fi
 
-    local script_name
-    script_name=$(jq -r '.script // "unknown"' "$meta_file")
-    local num_changes
-    num_changes=$(jq '.changes | length' "$meta_file")
+    # Include changes an interrupted script appended but never folded in
+    local pending_file meta_json
+    pending_file=$(pending_entries_file "$meta_file")
+    if [[ -s "$pending_file" ]]; then
+        meta_json=$(jq --slurpfile pending "$pending_file" '.changes += $pending' "$meta_file")
+    else
+        meta_json=$(cat "$meta_file")
+    fi
+
+    local script_name num_changes
+    IFS=$'\t' read -r script_name num_changes \
+        < <(jq -r '[.script // "unknown", (.changes | length)] | @tsv' <<< "$meta_json")
 
     if [[ "$num_changes" -eq 0 ]]; then
         show_warning "No changes recorded in $meta_file — nothing to roll back"
@@ -92,13 +110,12 @@ apply_rollback_from_file() {
 
     show_progress "Rolling back $num_changes change(s) from $script_name..."
 
-    # Process changes in reverse order (LIFO)
-    local i
-    for ((i = num_changes - 1; i >= 0; i--)); do
-        local component detail rollback_cmd
-        component=$(jq -r ".changes[$i].component // \"\"" "$meta_file")
-        detail=$(jq -r ".changes[$i].detail // \"\"" "$meta_file")
-        rollback_cmd=$(jq -r ".changes[$i].rollback_command // \"\"" "$meta_file")
+    # Process changes in reverse order (LIFO). A single jq pass streams the
+    # fields NUL-delimited on fd 3, so rollback commands keep the real stdin.
+    local component detail rollback_cmd
+    while IFS= read -r -d '' -u 3 component \
+        && IFS= read -r -d '' -u 3 detail \
+        && IFS= read -r -d '' -u 3 rollback_cmd; do
 
         # Try fallback: if component looks like domain/key, use defaults delete
         if [[ -z "$rollback_cmd" ]] && [[ "$component" == */* ]]; then
@@ -128,7 +145,9 @@ apply_rollback_from_file() {
             show_error "Failed to roll back: $detail (command: $rollback_cmd)"
             failed=$((failed + 1))
         fi
-    done
+    done 3< <(jq -j '.changes | reverse | .[]
+        | (.component // ""), "\u0000", (.detail // ""), "\u0000", (.rollback_command // ""), "\u0000"' \
+        <<< "$meta_json")
 
     if [[ "$JSON_OUTPUT" == "true" ]]; then
         cat <<EOF
@@ -9,19 +9,21 @@ import subprocess
 import sys
 from typing import Any, Dict, List
 
+from rollback import merge_pending_changes
+
 
 def load_meta(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return merge_pending_changes(path, json.load(f))
 
 
-def derive_fallback_rollback(change: Dict[str, Any]) -> str:
+def derive_fallback_rollback(change: Dict[str, Any]) -> List[str]:
     component = str(change.get("component", ""))
     if "/" in component:
         domain, key = component.split("/", 1)
         if domain and key:
-            return f"defaults delete {shlex.quote(domain)} {shlex.quote(key)}"
-    return ""
+            return ["defaults", "delete", domain, key]
+    return []
 
 
 def apply_rollback(meta: Dict[str, Any], dry_run: bool = False) -> Dict[str, Any]:
@@ -31,8 +33,11 @@ def apply_rollback(meta: Dict[str, Any], dry_run: bool = False) -> Dict[str, Any
 
     for change in reversed(changes):
         cmd = str(change.get("rollback_command") or "").strip()
+        argv: List[str] = []
         if not cmd:
-            cmd = derive_fallback_rollback(change)
+            # Keep the derived command as argv so it runs without a shell.
+            argv = derive_fallback_rollback(change)
+            cmd = shlex.join(argv)
         if not cmd:
             failed.append({"change": change, "reason": "missing rollback command"})
             continue
@@ -41,7 +46,10 @@ def apply_rollback(meta: Dict[str, Any], dry_run: bool = False) -> Dict[str, Any
             applied.append({"change": change, "command": cmd, "dry_run": True})
             continue
 
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=False)
+        if argv:
+            result = subprocess.run(argv, capture_output=True, text=True, check=False)
+        else:
+            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=False)
         entry = {
             "change": change,
             "command": cmd,
@@ -1,9 +1,19 @@
+import copy
 import os
 import glob
 import yaml
 from typing import List, Dict, Any, Optional
 from utils import sanitised_input, MacSecurityRule
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed rule YAML keyed by realpath, holding (mtime_ns, data); rule files are
+# read twice per rule in get_rule_yaml, so this halves parsing during
+# collect_rules. A changed mtime replaces the entry, so the cache stays bounded
+# by the number of rule files.
+_YAML_CACHE: Dict[str, tuple] = {}
+
 class RuleHandler:
     """Manages security rule collection, processing, and baseline generation."""
 
@@ -21,10 +31,17 @@ class RuleHandler:
 
     @staticmethod
     def _load_yaml_file(filepath: str) -> Dict[str, Any]:
-        """Load a YAML file with error handling."""
+        """Load a YAML file with error handling, reusing cached parses of unchanged files."""
         try:
-            with open(filepath, 'r') as file:
-                return yaml.load(file, Loader=yaml.SafeLoader) or {}
+            path = os.path.realpath(filepath)
+            mtime_ns = os.stat(path).st_mtime_ns
+            entry = _YAML_CACHE.get(path)
+            if entry is None or entry[0] != mtime_ns:
+                with open(path, 'r') as file:
+                    entry = (mtime_ns, yaml.load(file, Loader=_YAML_LOADER) or {})
+                _YAML_CACHE[path] = entry
+            # Callers mutate nested tags and references, so never hand out the cached objects
+            return copy.deepcopy(entry[1])
         except FileNotFoundError:
             print(f"File not found: {filepath}")
             return {}
@@ -32,24 +49,64 @@ class RuleHandler:
             print(f"Error parsing YAML file {filepath}: {str(e)}")
             return {}
 
+    @staticmethod
+    def _scan_yaml_files(directory: str) -> List[str]:
+        """Recursively list YAML files under a directory with a single os.scandir walk.
+
+        Mirrors glob's "**/*.yaml" semantics by skipping hidden entries.
+        """
+        found = []
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.yaml') and entry.is_file():
+                            found.append(entry.path)
+            except OSError:
+                continue
+        return found
+
+    @staticmethod
+    def _index_by_name(paths: List[str]) -> Dict[str, str]:
+        """Map each file name to its first path in sorted order."""
+        index: Dict[str, str] = {}
+        for path in sorted(paths):
+            index.setdefault(os.path.basename(path), path)
+        return index
+
     @classmethod
-    def get_rule_yaml(cls, rule_file: str, custom: bool = False) -> Dict[str, Any]:
-        """Merge rule YAML from original and custom sources."""
+    def get_rule_yaml(cls, rule_file: str, custom: bool = False,
+                      rule_index: Optional[Dict[str, str]] = None,
+                      custom_index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Merge rule YAML from original and custom sources.
+
+        rule_index/custom_index map file names to paths (see collect_rules);
+        when omitted, the rule directories are searched with glob.
+        """
         resulting_yaml = {}
         file_name = os.path.basename(rule_file)
 
-        custom_pattern = os.path.join(cls.CUSTOM_RULES_DIR, "**", file_name)
-        rule_pattern = os.path.join(cls.RULES_DIR, "**", file_name)
+        def find(index: Optional[Dict[str, str]], directory: str) -> Optional[str]:
+            if index is not None:
+                return index.get(file_name)
+            paths = glob.glob(os.path.join(directory, "**", file_name), recursive=True)
+            return paths[0] if paths else None
 
         if custom:
             print(f"Custom settings found for rule: {file_name}")
-            override_paths = glob.glob(custom_pattern, recursive=True)
-            rule_yaml = cls._load_yaml_file(override_paths[0]) if override_paths else {}
+            override_path = find(custom_index, cls.CUSTOM_RULES_DIR)
+            rule_yaml = cls._load_yaml_file(override_path) if override_path else {}
         else:
             rule_yaml = cls._load_yaml_file(rule_file)
 
-        og_paths = glob.glob(rule_pattern, recursive=True) or glob.glob(custom_pattern, recursive=True)
-        og_rule_yaml = cls._load_yaml_file(og_paths[0]) if og_paths else {}
+        og_path = find(rule_index, cls.RULES_DIR) or find(custom_index, cls.CUSTOM_RULES_DIR)
+        og_rule_yaml = cls._load_yaml_file(og_path) if og_path else {}
 
         for field in og_rule_yaml:
             value = rule_yaml.get(field, og_rule_yaml[field])
@@ -68,8 +125,13 @@ class RuleHandler:
                         'odv', 'tags', 'id', 'references', 'result', 'discussion']
         reference_types = ['disa_stig', 'cci', 'cce', '800-53r4', 'srg']
 
-        rule_files = sorted(glob.glob(os.path.join(cls.RULES_DIR, "**/*.yaml"), recursive=True) + 
-                          glob.glob(os.path.join(cls.CUSTOM_RULES_DIR, "**/*.yaml"), recursive=True))
+        # Walk each rules tree once and resolve per-rule lookups from the index,
+        # rather than re-globbing both trees for every rule file.
+        rule_paths = cls._scan_yaml_files(cls.RULES_DIR)
+        custom_paths = cls._scan_yaml_files(cls.CUSTOM_RULES_DIR)
+        rule_index = cls._index_by_name(rule_paths)
+        custom_index = cls._index_by_name(custom_paths)
+        rule_files = sorted(rule_paths + custom_paths)
         if not rule_files:
             raise RuntimeError(
                 "No rule files found. Expected YAML rules under "
@@ -78,7 +140,7 @@ class RuleHandler:
             )
 
         for rule_file in rule_files:
-            rule_yaml = cls.get_rule_yaml(rule_file)
+            rule_yaml = cls.get_rule_yaml(rule_file, rule_index=rule_index, custom_index=custom_index)
             
             for key in required_keys:
                 rule_yaml.setdefault(key, "missing")
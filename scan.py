@@ -9,9 +9,17 @@ import json
 import os
 import subprocess
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 
 from odv import load_odv_defaults, get_effective_check_command
-from exemptions import load_exemptions, get_exempt_ids, filter_rules_with_exemptions
+from exemptions import load_exemptions, get_exempt_ids, get_exemptions_by_id, \
+    filter_rules_with_exemptions
+
+# Checks are read-only and spend their time waiting on subprocesses,
+# so a small thread pool overlaps them without contending for the GIL.
+DEFAULT_CHECK_WORKERS = 8
+
+SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 
 
 def load_rules(rules_dir):
@@ -44,9 +52,8 @@ def filter_rules_by_profile(rules, profile_rule_ids):
 
 def filter_rules_by_severity(rules, min_severity):
     """Filter rules to those at or above a minimum severity level."""
-    severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-    threshold = severity_order.get(min_severity, 0)
-    return [r for r in rules if severity_order.get(r.get("severity", "low"), 0) >= threshold]
+    threshold = SEVERITY_ORDER.get(min_severity, 0)
+    return [r for r in rules if SEVERITY_ORDER.get(r.get("severity", "low"), 0) >= threshold]
 
 
 def run_check(rule, timeout=30, odv_values=None):
@@ -73,9 +80,30 @@ def run_check(rule, timeout=30, odv_values=None):
         return False, str(e)
 
 
+def map_rules(func, rules, workers=DEFAULT_CHECK_WORKERS):
+    """Apply func to each rule on a thread pool, returning results in rule order.
+
+    Runs inline when workers <= 1 or there is at most one rule.
+    """
+    if workers <= 1 or len(rules) <= 1:
+        return [func(rule) for rule in rules]
+    with ThreadPoolExecutor(max_workers=min(workers, len(rules))) as executor:
+        return list(executor.map(func, rules))
+
+
+def run_checks(rules, timeout=30, odv_values=None, workers=DEFAULT_CHECK_WORKERS):
+    """Run check commands for several rules concurrently.
+
+    Returns a list of (passed, detail) tuples in the same order as rules.
+    """
+    return map_rules(
+        lambda rule: run_check(rule, timeout=timeout, odv_values=odv_values), rules, workers
+    )
+
+
 def scan(rules_dir, profiles_dir=None, profile_name=None,
          min_severity=None, dry_run=False, timeout=30, odv_file=None,
-         exempt_file=None):
+         exempt_file=None, workers=DEFAULT_CHECK_WORKERS):
     """Run a compliance scan and return structured results.
 
     Args:
@@ -86,6 +114,7 @@ def scan(rules_dir, profiles_dir=None, profile_name=None,
         dry_run: If True, list rules without executing checks.
         timeout: Per-check timeout in seconds.
         odv_file: Optional path to ODV overrides YAML file.
+        workers: Number of checks to run concurrently (1 runs them serially).
 
     Returns:
         dict with keys: rules_scanned, passed, failed, errors, results, summary.
@@ -119,7 +148,11 @@ def scan(rules_dir, profiles_dir=None, profile_name=None,
     failed_count = 0
     error_count = 0
 
-    for rule in rules:
+    outcomes = [] if dry_run else run_checks(
+        rules, timeout=timeout, odv_values=odv_values, workers=workers
+    )
+
+    for index, rule in enumerate(rules):
         entry = {
             "id": rule["id"],
             "title": rule.get("title", ""),
@@ -129,7 +162,7 @@ def scan(rules_dir, profiles_dir=None, profile_name=None,
             entry["status"] = "dry-run"
             entry["check"] = get_effective_check_command(rule, odv_values)
         else:
-            ok, detail = run_check(rule, timeout=timeout, odv_values=odv_values)
+            ok, detail = outcomes[index]
             if ok:
                 entry["status"] = "pass"
                 passed_count += 1
@@ -141,10 +174,9 @@ def scan(rules_dir, profiles_dir=None, profile_name=None,
         results.append(entry)
 
     # Add exempted rules to results with "exempt" status
+    exemption_by_id = get_exemptions_by_id(exemptions)
     for rule in exempted_rules:
-        ex_info = None
-        if exemptions:
-            ex_info = next((e for e in exemptions if e["rule_id"] == rule["id"]), None)
+        ex_info = exemption_by_id.get(rule["id"])
         entry = {
             "id": rule["id"],
             "title": rule.get("title", ""),
@@ -72,6 +72,70 @@ class TestRulePathHandling(unittest.TestCase):
                 RuleHandler.collect_rules(root_dir=tmp)
         self.assertIn("No rule files found", str(ctx.exception))
 
+    def test_collect_rules_walks_rule_trees_without_per_rule_glob(self):
+        fixture_root = pathlib.Path(__file__).resolve().parent / "fixtures" / "minimal_project"
+        with patch("rule_handler.glob.glob", side_effect=AssertionError("unexpected glob")):
+            rules = RuleHandler.collect_rules(root_dir=str(fixture_root))
+        self.assertEqual([r.rule_id for r in rules], ["system_settings_test_rule"])
+        self.assertEqual(rules[0].rule_tags, ["stig"])
+
+    def test_load_yaml_file_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rule.yaml")
+            with open(path, "w") as f:
+                f.write("id: first\n")
+            with patch("rule_handler.yaml.load", wraps=yaml.load) as mock_load:
+                first = RuleHandler._load_yaml_file(path)
+                first["id"] = "mutated"
+                second = RuleHandler._load_yaml_file(path)
+                self.assertEqual(mock_load.call_count, 1)
+                self.assertEqual(second["id"], "first")
+
+                with open(path, "w") as f:
+                    f.write("id: second\n")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                third = RuleHandler._load_yaml_file(path)
+                self.assertEqual(mock_load.call_count, 2)
+                self.assertEqual(third["id"], "second")
+
+    def test_load_yaml_file_returns_independent_nested_values(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rule.yaml")
+            with open(path, "w") as f:
+                f.write("id: r\ntags:\n  - stig\nreferences:\n  cce:\n    - CCE-1\n")
+            first = RuleHandler._load_yaml_file(path)
+            first["tags"].append("cis_lvl1")
+            first["references"]["cce"].append("CCE-2")
+            second = RuleHandler._load_yaml_file(path)
+        self.assertEqual(second["tags"], ["stig"])
+        self.assertEqual(second["references"], {"cce": ["CCE-1"]})
+
+    def test_load_yaml_file_replaces_stale_cache_entry(self):
+        import rule_handler
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rule.yaml")
+            before = len(rule_handler._YAML_CACHE)
+            for idx in range(3):
+                with open(path, "w") as f:
+                    f.write(f"id: v{idx}\n")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + (idx + 1) * 1_000_000))
+                self.assertEqual(RuleHandler._load_yaml_file(path)["id"], f"v{idx}")
+        self.assertEqual(len(rule_handler._YAML_CACHE) - before, 1)
+
+    def test_yaml_loader_prefers_libyaml_and_parses_like_safe_loader(self):
+        import rule_handler
+        self.assertIs(rule_handler._YAML_LOADER, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        fixture = pathlib.Path(__file__).resolve().parent / "fixtures" / "minimal_project"
+        for path in sorted(fixture.rglob("*.yaml")):
+            text = path.read_text()
+            self.assertEqual(
+                yaml.load(text, Loader=rule_handler._YAML_LOADER),
+                yaml.load(text, Loader=yaml.SafeLoader),
+                str(path),
+            )
+
 
 class TestVersionAwareRuleSelection(unittest.TestCase):
     def test_filters_incompatible_rules_for_detected_major(self):
@@ -1414,6 +1478,33 @@ class TestRollbackApply(unittest.TestCase):
         self.assertEqual(result["applied_count"], 1)
         self.assertIn("defaults delete", result["applied"][0]["command"])
 
+    def test_derive_fallback_rollback_returns_argv(self):
+        """The derived fallback is an argv list; nothing derivable gives []."""
+        import rollback_apply
+        self.assertEqual(
+            rollback_apply.derive_fallback_rollback({"component": "com.apple.test/Some Key"}),
+            ["defaults", "delete", "com.apple.test", "Some Key"],
+        )
+        self.assertEqual(rollback_apply.derive_fallback_rollback({"component": "no-slash"}), [])
+
+    def test_derived_defaults_delete_runs_without_shell(self):
+        """Derived fallback commands are executed as argv, not through /bin/sh."""
+        import rollback_apply
+        meta = {
+            "script": "test",
+            "changes": [
+                {"component": "com.apple.test/Some Key", "detail": "set key",
+                 "rollback_command": ""}
+            ]
+        }
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        with patch("rollback_apply.subprocess.run", return_value=completed) as mock_run:
+            result = rollback_apply.apply_rollback(meta, dry_run=False)
+        self.assertEqual(result["applied_count"], 1)
+        called_args, called_kwargs = mock_run.call_args
+        self.assertEqual(called_args[0], ["defaults", "delete", "com.apple.test", "Some Key"])
+        self.assertNotIn("shell", called_kwargs)
+
     def test_completely_missing_rollback_command_recorded_as_failure(self):
         """If no rollback_command and no derivable fallback, record as failed."""
         import rollback_apply
@@ -1513,6 +1604,53 @@ class TestRollbackShellScript(unittest.TestCase):
             )
             self.assertNotEqual(result.returncode, 0)
 
+    def test_rollback_sh_list_shows_summary_fields(self):
+        """--list should report script, status and change count per file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            meta = {
+                "script": "privacy.sh",
+                "status": "applied_changes",
+                "changes": [
+                    {"component": "a", "detail": "first", "rollback_command": "echo a"},
+                    {"component": "b", "detail": "second", "rollback_command": "echo b"},
+                ]
+            }
+            with open(os.path.join(tmpdir, "privacy.sh_rollback_20260101_000000.json"), "w") as f:
+                json.dump(meta, f)
+            with open(os.path.join(tmpdir, "broken_rollback_20260101_000000.json"), "w") as f:
+                f.write("{not json")
+            env = os.environ.copy()
+            env["ALBATOR_STATE_DIR"] = tmpdir
+            result = subprocess.run(
+                ["bash", str(self.rollback_sh), "--list"],
+                capture_output=True, text=True, env=env
+            )
+            self.assertEqual(result.returncode, 0)
+            self.assertIn("(script=privacy.sh, status=applied_changes, changes=2)", result.stdout)
+            self.assertIn("(script=unknown, status=unknown, changes=0)", result.stdout)
+            self.assertIn("Found 2 rollback file(s)", result.stdout)
+
+    def test_rollback_sh_list_counts_pending_changes(self):
+        """--list should include changes still in the .pending.jsonl sidecar."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            meta = {
+                "script": "privacy.sh",
+                "status": "running",
+                "changes": [{"component": "a", "detail": "first", "rollback_command": "echo a"}],
+            }
+            with open(os.path.join(tmpdir, "privacy.sh_rollback_20260101_000000.json"), "w") as f:
+                json.dump(meta, f)
+            with open(os.path.join(tmpdir, "privacy.sh_rollback_20260101_000000.pending.jsonl"), "w") as f:
+                f.write(json.dumps({"component": "b", "detail": "second", "rollback_command": "echo b"}) + "\n")
+            env = os.environ.copy()
+            env["ALBATOR_STATE_DIR"] = tmpdir
+            result = subprocess.run(
+                ["bash", str(self.rollback_sh), "--list"],
+                capture_output=True, text=True, env=env
+            )
+            self.assertEqual(result.returncode, 0)
+            self.assertIn("(script=privacy.sh, status=running, changes=2)", result.stdout)
+
     def test_rollback_sh_dry_run_with_metadata(self):
         """Dry-run should succeed with valid metadata and print commands."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -2043,6 +2181,17 @@ class TestScanModule(unittest.TestCase):
         total = result["rules_scanned"]
         self.assertEqual(result["passed"] + result["failed"], total)
 
+    def test_run_checks_preserves_rule_order(self):
+        """run_checks returns outcomes in rule order whatever the worker count."""
+        rules = [
+            {"id": f"r{i}", "check": "true" if i % 2 == 0 else "false"}
+            for i in range(6)
+        ]
+        serial = self.scan_mod.run_checks(rules, timeout=5, workers=1)
+        parallel = self.scan_mod.run_checks(rules, timeout=5, workers=4)
+        self.assertEqual([ok for ok, _ in serial], [True, False, True, False, True, False])
+        self.assertEqual([ok for ok, _ in parallel], [ok for ok, _ in serial])
+
 
 class TestScanCLIIntegration(unittest.TestCase):
     """Tests for 'albator_cli.py scan' CLI integration (experiment 17)."""
@@ -2362,6 +2511,15 @@ class TestRollbackModule(unittest.TestCase):
         files = self.rb.find_metadata_files(self.tmpdir)
         self.assertEqual(len(files), 2)
 
+    def test_find_latest_metadata_matches_sorted_order(self):
+        """find_latest_metadata returns the first entry of find_metadata_files."""
+        self.assertIsNone(self.rb.find_latest_metadata(self.tmpdir))
+        self._write_metadata("privacy_rollback_20260101_000000.json", {"changes": []})
+        self._write_metadata("privacy_rollback_20260102_000000.json", {"changes": []})
+        self._write_metadata("firewall_rollback_20260103_000000.json", {"changes": []})
+        self.assertEqual(self.rb.find_latest_metadata(self.tmpdir),
+                         self.rb.find_metadata_files(self.tmpdir)[0])
+
     def test_load_metadata_file_not_found(self):
         """load_metadata raises FileNotFoundError for missing file."""
         with self.assertRaises(FileNotFoundError):
@@ -2373,6 +2531,60 @@ class TestRollbackModule(unittest.TestCase):
         data = self.rb.load_metadata(path)
         self.assertEqual(data["script"], "test.sh")
 
+    def test_load_metadata_merges_pending_changes(self):
+        """load_metadata appends changes left in the pending JSON-lines file."""
+        path = self._write_metadata("test_rollback_002.json", {
+            "script": "test.sh", "changes": [{"component": "a", "detail": "first"}]
+        })
+        with open(os.path.join(self.tmpdir, "test_rollback_002.pending.jsonl"), "w") as f:
+            f.write(json.dumps({"component": "b", "detail": "second"}) + "\n")
+        data = self.rb.load_metadata(path)
+        self.assertEqual([c["detail"] for c in data["changes"]], ["first", "second"])
+        self.assertEqual(len(self.rb.find_metadata_files(self.tmpdir)), 1)
+
+    def test_script_state_folds_pending_changes_on_finalize(self):
+        """utils.sh folds appended changes into the metadata file once at finalize."""
+        utils_sh = pathlib.Path(__file__).resolve().parents[1] / "utils.sh"
+        script = (
+            f'source "{utils_sh}"; SCRIPT_NAME=t.sh; LOG_FILE=/dev/null; '
+            'init_script_state; '
+            'record_rollback_change "dom/A" "first" "echo A"; '
+            'record_rollback_change "dom/B" "second" "echo B"; '
+            'finalize_script_state applied_changes'
+        )
+        env = os.environ.copy()
+        env["ALBATOR_STATE_DIR"] = self.tmpdir
+        result = subprocess.run(["bash", "-c", script], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        files = self.rb.find_metadata_files(self.tmpdir)
+        self.assertEqual(len(files), 1)
+        self.assertFalse(os.path.exists(self.rb.pending_changes_path(files[0])))
+        with open(files[0]) as f:
+            data = json.load(f)
+        self.assertEqual(data["status"], "applied_changes")
+        self.assertEqual([c["detail"] for c in data["changes"]], ["first", "second"])
+
+    def test_script_state_fold_failure_keeps_exit_status(self):
+        """A failed fold keeps pending entries and does not change the exit code."""
+        utils_sh = pathlib.Path(__file__).resolve().parents[1] / "utils.sh"
+        script = (
+            f'set -euo pipefail; source "{utils_sh}"; SCRIPT_NAME=t.sh; LOG_FILE=/dev/null; '
+            'init_script_state; '
+            'record_rollback_change "dom/A" "first" "echo A"; '
+            'echo "{not json" > "$ROLLBACK_META_FILE"; '
+            'exit_with_status 0'
+        )
+        env = os.environ.copy()
+        env["ALBATOR_STATE_DIR"] = self.tmpdir
+        result = subprocess.run(["bash", "-c", script], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual([f for f in os.listdir(self.tmpdir) if f.endswith(".tmp")], [])
+        files = self.rb.find_metadata_files(self.tmpdir)
+        self.assertTrue(os.path.exists(self.rb.pending_changes_path(files[0])))
+        plans = [f for f in os.listdir(self.tmpdir) if "_plan_" in f and f.endswith(".json")]
+        with open(os.path.join(self.tmpdir, plans[0])) as f:
+            self.assertIn("finished_at", json.load(f))
+
     def test_list_rollbacks_empty(self):
         """list_rollbacks returns count=0 for empty dir."""
         result = self.rb.list_rollbacks(self.tmpdir)
@@ -2483,6 +2695,20 @@ class TestRollbackModule(unittest.TestCase):
         self.assertEqual(result["results"][0]["rollback_command"], "defaults delete com.apple.test SomeKey")
         self.assertEqual(result["results"][0]["status"], "would-rollback")
 
+    def test_apply_rollback_fallback_runs_argv_without_shell(self):
+        """apply_rollback runs the derived defaults delete as argv, not via bash -c."""
+        path = self._write_metadata("test_rollback_argv.json", {
+            "script": "test.sh",
+            "changes": [{"component": "com.apple.test/Key; touch x", "detail": "odd key"}]
+        })
+        proc = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+        with patch.object(self.rb.subprocess, "run", return_value=proc) as run:
+            result = self.rb.apply_rollback(path)
+        run.assert_called_once()
+        self.assertEqual(run.call_args[0][0], ["defaults", "delete", "com.apple.test", "Key; touch x"])
+        self.assertEqual(result["results"][0]["rollback_command"],
+                         "defaults delete com.apple.test 'Key; touch x'")
+
     def test_format_rollback_list_header(self):
         """format_rollback_list includes header."""
         result = self.rb.list_rollbacks(self.tmpdir)
@@ -2689,6 +2915,14 @@ class TestReportModule(unittest.TestCase):
         for sec in ("1", "2", "3", "4", "5", "6"):
             self.assertIn(sec, result["sections"], f"Missing section {sec}")
 
+    def test_generate_report_checks_shared_rules_once(self):
+        """Rules mapped to several CIS controls should only be checked once."""
+        unique_rules = {c["rule"] for c in self.report_mod.CIS_CONTROLS.values()}
+        with patch("scan.run_check", return_value=(True, "")) as mock_check:
+            result = self.report_mod.generate_report(self.rules_dir)
+        self.assertEqual(mock_check.call_count, len(unique_rules))
+        self.assertEqual(result["summary"]["passed"], len(self.report_mod.CIS_CONTROLS))
+
     def test_generate_report_with_profile(self):
         """Report with cis_level1 profile should mark L2-only controls as N/A."""
         result = self.report_mod.generate_report(
@@ -3358,7 +3592,10 @@ class TestCLIODVFlag(unittest.TestCase):
 # Experiment 23 — Exemption / Exception Management
 ###############################################################################
 
-from exemptions import load_exemptions, get_exempt_ids, filter_rules_with_exemptions, format_exemption_summary
+from exemptions import (
+    load_exemptions, get_exempt_ids, get_exemptions_by_id,
+    filter_rules_with_exemptions, format_exemption_summary,
+)
 
 
 class TestExemptionsLoading(unittest.TestCase):
@@ -3488,6 +3725,17 @@ class TestExemptionFiltering(unittest.TestCase):
         ids = get_exempt_ids(exemptions, include_expired=True)
         self.assertEqual(ids, {"os_a", "os_b"})
 
+    def test_get_exemptions_by_id(self):
+        """Exemption entries are indexed by rule ID; None gives an empty index."""
+        exemptions = [
+            {"rule_id": "os_a", "reason": "A", "approved_by": "X", "expires": None, "expired": False},
+            {"rule_id": "os_b", "reason": "B", "approved_by": "Y", "expires": "2020-01-01", "expired": True},
+        ]
+        by_id = get_exemptions_by_id(exemptions)
+        self.assertEqual(by_id["os_b"]["reason"], "B")
+        self.assertEqual(set(by_id), {"os_a", "os_b"})
+        self.assertEqual(get_exemptions_by_id(None), {})
+
     def test_filter_rules_with_exemptions(self):
         """Rules split correctly into active and exempted."""
         rules = [
@@ -4143,6 +4391,35 @@ class TestEvidenceCollectSystemMetadata(unittest.TestCase):
         self.assertTrue(len(meta["hostname"]) > 0)
 
 
+class TestGetMacosVersion(unittest.TestCase):
+    """Tests for utils.get_macos_version()."""
+
+    def setUp(self):
+        import utils
+        self.utils = utils
+        utils.get_macos_version.cache_clear()
+        self.addCleanup(utils.get_macos_version.cache_clear)
+
+    def test_lookup_is_cached(self):
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="26.3\n", stderr="")
+        with patch("utils.platform.mac_ver", return_value=("", ("", "", ""), "")), \
+             patch("utils.subprocess.run", return_value=completed) as mock_run:
+            self.assertEqual(self.utils.get_macos_version(), "26.3")
+            self.assertEqual(self.utils.get_macos_version(), "26.3")
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_prefers_platform_mac_ver(self):
+        with patch("utils.platform.mac_ver", return_value=("26.2", ("", "", ""), "")), \
+             patch("utils.subprocess.run") as mock_run:
+            self.assertEqual(self.utils.get_macos_version(), "26.2")
+        mock_run.assert_not_called()
+
+    def test_returns_none_without_sw_vers(self):
+        with patch("utils.platform.mac_ver", return_value=("", ("", "", ""), "")), \
+             patch("utils.subprocess.run", side_effect=FileNotFoundError("sw_vers")):
+            self.assertIsNone(self.utils.get_macos_version())
+
+
 class TestEvidenceCollectRuleEvidence(unittest.TestCase):
     """Tests for evidence.collect_rule_evidence()."""
 
@@ -4186,6 +4463,13 @@ class TestEvidenceCollectRuleEvidence(unittest.TestCase):
         self.assertEqual(ev["exit_code"], -1)
         self.assertIn("empty", ev.get("error", ""))
 
+    def test_collect_evidence_preserves_rule_order(self):
+        from evidence import collect_evidence
+        rules = [{"id": f"r{i}", "check": "true" if i % 2 == 0 else "false"} for i in range(6)]
+        evidence = collect_evidence(rules, timeout=5, workers=4)
+        self.assertEqual([ev["rule_id"] for ev in evidence], [r["id"] for r in rules])
+        self.assertEqual([ev["compliant"] for ev in evidence], [True, False, True, False, True, False])
+
     def test_timeout_returns_error(self):
         from evidence import collect_rule_evidence
         rule = {"id": "test_timeout", "title": "Slow", "severity": "low",
@@ -1,3 +1,6 @@
+import platform
+import subprocess
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Type, Iterable
 from string import Template
 
@@ -101,3 +104,20 @@ def available_tags(all_rules: List[MacSecurityRule]) -> None:
     """Print all unique tags from the rules."""
     unique_tags = sorted({tag for rule in all_rules for tag in rule.rule_tags} | {"all_rules"})
     print("\n".join(unique_tags))
+
+@lru_cache(maxsize=1)
+def get_macos_version() -> Optional[str]:
+    """Return the macOS product version, or None off-macOS. Cached for the process lifetime."""
+    # platform.mac_ver() reads SystemVersion.plist in-process; sw_vers is only a fallback.
+    version = platform.mac_ver()[0]
+    if version:
+        return version
+    try:
+        result = subprocess.run(
+            ["sw_vers", "-productVersion"], capture_output=True, text=True, timeout=5, check=False
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
@@ -46,6 +46,53 @@ EOF
     cat > "$DRYRUN_PLAN_FILE" <<EOF
 {"script":"${SCRIPT_NAME:-unknown}","started_at":"$(date -u +"%Y-%m-%dT%H:%M:%SZ")","planned_actions":[]}
 EOF
+    # Entries are appended as JSON lines and folded into the metadata files
+    # once, instead of rewriting the whole document for every entry.
+    ROLLBACK_PENDING_FILE=$(pending_entries_file "$ROLLBACK_META_FILE")
+    DRYRUN_PENDING_FILE=$(pending_entries_file "$DRYRUN_PLAN_FILE")
+    : > "$ROLLBACK_PENDING_FILE"
+    : > "$DRYRUN_PENDING_FILE"
+    trap flush_script_state EXIT
+}
+
+# Path of the JSON-lines file holding entries not yet folded into a metadata file
+pending_entries_file() {
+    echo "${1%.json}.pending.jsonl"
+}
+
+# Fold pending JSON-lines entries into an array field of a metadata file,
+# applying an optional extra jq filter in the same pass
+_fold_pending_entries() {
+    local meta_file="$1"
+    local field="$2"
+    local extra_filter="$3"
+    shift 3
+    local pending_file
+    pending_file=$(pending_entries_file "$meta_file")
+    [[ -f "$meta_file" ]] || return 0
+    if command -v jq >/dev/null 2>&1; then
+        local tmp_file="${meta_file}.tmp"
+        local fold_ok=true
+        if [[ -s "$pending_file" ]]; then
+            jq --slurpfile pending "$pending_file" "$@" ".${field} += \$pending | ${extra_filter}" \
+               "$meta_file" > "$tmp_file" && mv "$tmp_file" "$meta_file" || fold_ok=false
+        elif [[ "$extra_filter" != "." ]]; then
+            jq "$@" "$extra_filter" "$meta_file" > "$tmp_file" && mv "$tmp_file" "$meta_file" || fold_ok=false
+        fi
+        # Never fail here: this runs from the EXIT trap and must not replace
+        # the script's exit code. Keep the pending entries for rollback.
+        if [[ "$fold_ok" != "true" ]]; then
+            rm -f "$tmp_file"
+            log "WARNING" "Could not update $meta_file; pending entries kept in $pending_file" >&2
+            return 0
+        fi
+    fi
+    rm -f "$pending_file"
+}
+
+flush_script_state() {
+    _fold_pending_entries "$ROLLBACK_META_FILE" "changes" "."
+    _fold_pending_entries "$DRYRUN_PLAN_FILE" "planned_actions" "."
 }
 
 record_rollback_change() {
@@ -54,10 +101,9 @@ record_rollback_change() {
     local rollback_command="${3:-}"
     ALBATOR_CHANGES=$((ALBATOR_CHANGES + 1))
     if command -v jq >/dev/null 2>&1; then
-        local tmp_file="${ROLLBACK_META_FILE}.tmp"
-        jq --arg component "$component" --arg detail "$detail" --arg rollback "$rollback_command" --arg ts "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
-           '.changes += [{"component":$component,"detail":$detail,"rollback_command":$rollback,"timestamp":$ts}]' \
-           "$ROLLBACK_META_FILE" > "$tmp_file" && mv "$tmp_file" "$ROLLBACK_META_FILE"
+        jq -cn --arg component "$component" --arg detail "$detail" --arg rollback "$rollback_command" --arg ts "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
+           '{"component":$component,"detail":$detail,"rollback_command":$rollback,"timestamp":$ts}' \
+           >> "$ROLLBACK_PENDING_FILE"
     fi
 }
 
@@ -66,10 +112,9 @@ record_plan_action() {
     local action="$2"
     local command_text="${3:-}"
     if command -v jq >/dev/null 2>&1; then
-        local tmp_file="${DRYRUN_PLAN_FILE}.tmp"
-        jq --arg component "$component" --arg action "$action" --arg command "$command_text" --arg ts "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
-           '.planned_actions += [{"component":$component,"action":$action,"command":$command,"timestamp":$ts}]' \
-           "$DRYRUN_PLAN_FILE" > "$tmp_file" && mv "$tmp_file" "$DRYRUN_PLAN_FILE"
+        jq -cn --arg component "$component" --arg action "$action" --arg command "$command_text" --arg ts "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
+           '{"component":$component,"action":$action,"command":$command,"timestamp":$ts}' \
+           >> "$DRYRUN_PENDING_FILE"
     fi
 }
 
@@ -81,17 +126,13 @@ record_noop() {
 
 finalize_script_state() {
     local script_status="$1"
-    if command -v jq >/dev/null 2>&1; then
-        local tmp_file="${ROLLBACK_META_FILE}.tmp"
-        jq --arg status "$script_status" --arg finished "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
-           '.status = $status | .finished_at = $finished' \
-           "$ROLLBACK_META_FILE" > "$tmp_file" && mv "$tmp_file" "$ROLLBACK_META_FILE"
-
-        local plan_tmp_file="${DRYRUN_PLAN_FILE}.tmp"
-        jq --arg status "$script_status" --arg finished "$(date -u +"%Y-%m-%dT%H:%M:%SZ")" \
-           '.status = $status | .finished_at = $finished' \
-           "$DRYRUN_PLAN_FILE" > "$plan_tmp_file" && mv "$plan_tmp_file" "$DRYRUN_PLAN_FILE"
-    fi
+    local finished
+    finished=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
+    local status_filter='.status = $status | .finished_at = $finished'
+    _fold_pending_entries "$ROLLBACK_META_FILE" "changes" "$status_filter" \
+        --arg status "$script_status" --arg finished "$finished"
+    _fold_pending_entries "$DRYRUN_PLAN_FILE" "planned_actions" "$status_filter" \
+        --arg status "$script_status" --arg finished "$finished"
 }
 
 exit_with_status() {
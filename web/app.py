@@ -16,6 +16,7 @@ import logging
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, send_from_directory
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 try:
@@ -42,8 +43,19 @@ except Exception:
     def emit(*args, **kwargs):  # type: ignore[override]
         return None
 
-# Add lib directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+# Add lib directory to path for imports. Only when it exists: a dead entry at
+# the front of sys.path is probed by every later import in the process.
+_LIB_DIR = os.path.join(os.path.dirname(__file__), '..', 'lib')
+if os.path.isdir(_LIB_DIR):
+    sys.path.insert(0, _LIB_DIR)
+
+# The repo root holds the shared CLI helpers (utils.py). Append it so lib/
+# modules keep precedence over same-named root modules.
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from utils import get_macos_version
 
 
 def _fallback_logger(name: str):
@@ -169,6 +181,19 @@ def _probe_command(cmd: List[str], expected_substring: str = "", requires_elevat
             "hint": "",
         }
 
+# Component status probes: name -> (command, _probe_command keyword arguments)
+_STATUS_PROBES = {
+    'firewall': (
+        ['/usr/libexec/ApplicationFirewall/socketfilterfw', '--getglobalstate'],
+        {'expected_substring': 'enabled',
+         'requires_elevation_hint': 'Run with elevated privileges for full firewall status.'},
+    ),
+    'encryption': (['fdesetup', 'status'], {'expected_substring': 'FileVault is On'}),
+    'gatekeeper': (['spctl', '--status'], {'expected_substring': 'assessments enabled'}),
+    'sip': (['csrutil', 'status'], {'expected_substring': 'enabled'}),
+}
+
+
 class OperationRunner:
     """Handles running security operations with real-time updates"""
     
@@ -301,28 +326,20 @@ def get_system_status():
     try:
         status = {
             'timestamp': datetime.now().isoformat(),
-            'macos_version': subprocess.check_output(['sw_vers', '-productVersion'], text=True).strip(),
+            'macos_version': get_macos_version() or 'unknown',
             'components': {}
         }
-        
-        status['components']['firewall'] = _probe_command(
-            ['/usr/libexec/ApplicationFirewall/socketfilterfw', '--getglobalstate'],
-            expected_substring='enabled',
-            requires_elevation_hint='Run with elevated privileges for full firewall status.'
-        )
-        status['components']['encryption'] = _probe_command(
-            ['fdesetup', 'status'],
-            expected_substring='FileVault is On'
-        )
-        status['components']['gatekeeper'] = _probe_command(
-            ['spctl', '--status'],
-            expected_substring='assessments enabled'
-        )
-        status['components']['sip'] = _probe_command(
-            ['csrutil', 'status'],
-            expected_substring='enabled'
-        )
-        
+
+        # The probes are independent and mostly wait on their subprocess,
+        # so run them side by side instead of one after another
+        with ThreadPoolExecutor(max_workers=len(_STATUS_PROBES)) as executor:
+            futures = {
+                name: executor.submit(_probe_command, cmd, **kwargs)
+                for name, (cmd, kwargs) in _STATUS_PROBES.items()
+            }
+            for name, future in futures.items():
+                status['components'][name] = future.result()
+
         return jsonify({
             'success': True,
             'status': status